@@ -0,0 +1,68 @@
+"""
+build.py: Optional mypyc compilation of the soft check hot path.
+
+Poetry calls `build` while generating the wheel. mypy is a build requirement, so `check_functions`
+and `check_log` are compiled to C extensions with mypyc unless the `SOFT_CHECK_NO_MYPYC`
+environment variable is set, in which case the package is built as pure Python. The ImportError
+fallback only covers builds run without the declared build requirements.
+
+The compiled modules are optional: if the C extensions fail to build (e.g. no compiler on the
+host), the pure Python modules are installed instead.
+"""
+import os
+import sys
+
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+MYPYC_MODULES = [
+    "soft_check/check_functions.py",
+    "soft_check/check_log.py",
+]
+
+
+class OptionalBuildExt(build_ext):
+    """
+    `build_ext` that falls back to the pure Python modules when the extensions cannot be built.
+    """
+
+    def run(self):
+        """
+        Build the extensions, or remove any that were built if one of them fails.
+
+        Returns:
+        - None
+        """
+        try:
+            super().run()
+        except (CCompilerError, ExecError, PlatformError) as exc:
+            # The compiled modules share one mypyc runtime extension, so they are installed
+            # together or not at all.
+            for output in self.get_outputs():
+                if os.path.exists(output):
+                    os.remove(output)
+            print(
+                f"soft_check: could not build the mypyc extensions ({exc}); "
+                "installing the pure Python modules instead.",
+                file=sys.stderr,
+            )
+
+
+def build(setup_kwargs):
+    """
+    Add the mypyc extension modules to the setup keyword arguments.
+
+    Args:
+    - setup_kwargs (dict): Keyword arguments that will be passed to `setup()`.
+
+    Returns:
+    - None
+    """
+    if os.environ.get("SOFT_CHECK_NO_MYPYC"):
+        return
+    try:
+        from mypyc.build import mypycify  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return
+    setup_kwargs["ext_modules"] = mypycify(MYPYC_MODULES)
+    setup_kwargs["cmdclass"] = {"build_ext": OptionalBuildExt}
@@ -1,6 +1,11 @@
-import pytest
+import sys
 
-pytest.register_assert_rewrite("soft_check.check_functions")
+# Assertion rewriting only matters inside a pytest run, and pytest is always imported by then.
+# Skipping it otherwise avoids importing pytest just to use soft_check.
+if "pytest" in sys.modules:
+    import pytest
+
+    pytest.register_assert_rewrite("soft_check.check_assert")
 
 from soft_check.context_manager import check
 from soft_check.check_raises import raises
@@ -9,9 +14,9 @@ from soft_check.check_functions import *
 from soft_check import check_functions
 
 
-setattr(check, "raises", raises)
-setattr(check, "any_failures", any_failures)
-setattr(check, "check", check)
-
-for func in check_functions.__all__:
-    setattr(check, func, getattr(check_functions, func))
+vars(check).update(
+    {name: getattr(check_functions, name) for name in check_functions.__all__},
+    raises=raises,
+    any_failures=any_failures,
+    check=check,
+)
@@ -0,0 +1,35 @@
+"""
+check_assert.py: The hard assertion helper of soft_check.
+
+`assert_equal` is kept out of `check_functions`, which may be compiled with mypyc: pytest's
+assertion rewriting, which adds the compared values to the AssertionError, only applies to
+Python source modules. `check_functions` re-exports it.
+"""
+from typing import Any
+
+# Hide this module's frames from pytest tracebacks, as in `check_functions`.
+__tracebackhide__ = True
+
+__all__ = ["assert_equal"]
+
+
+def assert_equal(first_value: Any, second_value: Any, msg: Any = "") -> None:
+    """
+    Check if two values are equal and raise an AssertionError if they are not.
+
+    Parameters:
+    - first_value: The first value for comparison.
+    - second_value: The second value for comparison.
+    - msg (optional): A custom error message to include in the AssertionError.
+
+    Raises:
+    - AssertionError: If `first_value` is not equal to `second_value`, an AssertionError is raised.
+      If a custom message (`msg`) is provided, it will be included in the exception.
+
+    Example:
+    >>> assert_equal(3, 3, "Values should be equal")  # No exception is raised
+    >>> assert_equal(3, 5, "Values should be equal")  # Raises AssertionError with the provided \
+    message
+
+    """
+    assert first_value == second_value, msg
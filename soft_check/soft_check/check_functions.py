@@ -55,10 +55,21 @@ For detailed information about each assertion function, refer to the function
 docstrings within this module.
 """
 import functools
+import inspect
+import math
+from typing import Any, Callable
 
-import pytest
+from .check_assert import assert_equal
+from .check_log import _LazyMessage, log_failure
 
-from .check_log import log_failure
+# pytest hides traceback entries whose frame has `__tracebackhide__` in its locals or globals.
+# Setting it once at module level hides every function here (including the wrappers generated by
+# check_func) without a per-call assignment.
+__tracebackhide__ = True
+
+# The mypyc build enforces annotations at runtime, so arguments the checks only pass through
+# (messages, tolerances, flags) are annotated as Any: a non-str msg or an int flag must still
+# reach log_failure instead of raising TypeError.
 
 __all__ = [
     "assert_equal",
@@ -85,7 +96,96 @@ __all__ = [
 ]
 
 
-def check_func(func):
+_WRAPPER_TEMPLATE = """\
+def _factory(_func, {defaults}):
+    def wrapper({params}):
+        try:
+            _func({call_args})
+            return True
+        except AssertionError as exc:
+            log_failure(exc)
+            return False
+    return wrapper
+"""
+
+_RESERVED_NAMES = frozenset({"log_failure", "AssertionError", "True", "False"})
+
+
+def _make_specialized_wrapper(func: Callable[..., Any]) -> Callable[..., bool] | None:
+    """
+    Generate a check_func wrapper with the exact signature of `func`.
+
+    Calling through a wrapper that spells out the wrapped function's parameters avoids packing
+    and unpacking `*args`/`**kwds` on every call.
+
+    Parameters:
+    - func (callable): The function to be wrapped.
+
+    Returns:
+    - callable or None: The generated wrapper, or None if the signature of `func` cannot be
+                        reproduced and the generic wrapper should be used instead.
+    """
+    # Without follow_wrapped=False, a decorated func (e.g. by mock.patch) would report the
+    # signature of the function it wraps instead of the one it is actually called with.
+    try:
+        signature = inspect.signature(func, follow_wrapped=False)
+    except (TypeError, ValueError):
+        return None
+
+    params = []
+    call_args = []
+    defaults = {}
+    positional_only = False
+    seen_keyword_only = False
+    for index, param in enumerate(signature.parameters.values()):
+        name = param.name
+        if name.startswith("_") or name in _RESERVED_NAMES:
+            return None
+
+        if param.kind is not param.POSITIONAL_ONLY and positional_only:
+            params.append("/")
+            positional_only = False
+
+        if param.kind is param.VAR_POSITIONAL:
+            params.append(f"*{name}")
+            call_args.append(f"*{name}")
+            seen_keyword_only = True
+            continue
+        if param.kind is param.VAR_KEYWORD:
+            params.append(f"**{name}")
+            call_args.append(f"**{name}")
+            continue
+
+        if param.kind is param.KEYWORD_ONLY:
+            if not seen_keyword_only:
+                params.append("*")
+                seen_keyword_only = True
+            call_args.append(f"{name}={name}")
+        else:
+            positional_only = param.kind is param.POSITIONAL_ONLY
+            call_args.append(name)
+
+        if param.default is param.empty:
+            params.append(name)
+        else:
+            default_name = f"_default_{index}"
+            defaults[default_name] = param.default
+            params.append(f"{name}={default_name}")
+
+    if positional_only:
+        params.append("/")
+
+    source = _WRAPPER_TEMPLATE.format(
+        defaults=", ".join(defaults),
+        params=", ".join(params),
+        call_args=", ".join(call_args),
+    )
+    namespace: dict[str, Any] = {}
+    exec(source, globals(), namespace)  # pylint: disable=exec-used
+    return namespace["_factory"](func, **defaults)
+
+
+def check_func(func: Callable[..., Any]) -> Callable[..., bool]:
     """
     Decorator function for checking the validity of another function.
 
@@ -107,42 +207,40 @@ def check_func(func):
     def example_function():
         assert 1 + 1 == 3
     """
-    @functools.wraps(func)
-    def wrapper(*args, **kwds):
-        __tracebackhide__ = True
-        try:
-            func(*args, **kwds)
-            return True
-        except AssertionError as exc:
-            log_failure(exc)
-            return False
+    wrapper = _make_specialized_wrapper(func)
+    if wrapper is None:
+        def wrapper(*args, **kwds):
+            try:
+                func(*args, **kwds)
+                return True
+            except AssertionError as exc:
+                log_failure(exc)
+                return False
 
-    return wrapper
+    return functools.wraps(func)(wrapper)
 
 
-def assert_equal(first_value, second_value, msg=""):
+def _log_comparison_failure(first_value: Any, operator: str, second_value: Any, msg: Any) -> None:
     """
-    Check if two values are equal and raise an AssertionError if they are not.
+    Log the failure of a binary comparison check such as `equal` or `less`.
 
-    Parameters:
-    - first_value: The first value for comparison.
-    - second_value: The second value for comparison.
-    - msg (optional): A custom error message to include in the AssertionError.
-
-    Raises:
-    - AssertionError: If `first_value` is not equal to `second_value`, an AssertionError is raised.
-      If a custom message (`msg`) is provided, it will be included in the exception.
+    The "check <first_value> <operator> <second_value>" message is only built if the failure is
+    reported.
 
-    Example:
-    >>> assert_equal(3, 3, "Values should be equal")  # No exception is raised
-    >>> assert_equal(3, 5, "Values should be equal")  # Raises AssertionError with the provided \
-    message
+    Parameters:
+    - first_value: The first value of the comparison.
+    - operator (str): The comparison operator, e.g. "==" or "is not".
+    - second_value: The second value of the comparison.
+    - msg: The custom error message passed to the check.
 
+    Returns:
+    - None
     """
-    assert first_value == second_value, msg
+    log_failure(_LazyMessage(
+        lambda fv=first_value, op=operator, sv=second_value: f"check {fv} {op} {sv}"), msg)
 
 
-def equal(first_value, second_value, msg=""):
+def equal(first_value: Any, second_value: Any, msg: Any = "") -> bool:
     """
     Compare two values for equality.
 
@@ -159,14 +257,13 @@ def equal(first_value, second_value, msg=""):
     >>> equal(3, 5, "Values should be equal")  # Returns False and logs a failure message
 
     """
-    __tracebackhide__ = True
     if first_value == second_value:
         return True
-    log_failure(f"check {first_value} == {second_value}", msg)
+    _log_comparison_failure(first_value, "==", second_value, msg)
     return False
 
 
-def not_equal(first_value, second_value, msg=""):
+def not_equal(first_value: Any, second_value: Any, msg: Any = "") -> bool:
     """
     Compare two values for inequality.
 
@@ -183,14 +280,13 @@ def not_equal(first_value, second_value, msg=""):
     >>> not_equal(3, 3, "Values should not be equal")  # Returns False and logs a failure message
 
     """
-    __tracebackhide__ = True
     if first_value != second_value:
         return True
-    log_failure(f"check {first_value} != {second_value}", msg)
+    _log_comparison_failure(first_value, "!=", second_value, msg)
     return False
 
 
-def is_(first_value, second_value, msg=""):
+def is_(first_value: Any, second_value: Any, msg: Any = "") -> bool:
     """
     Check if two values refer to the same object.
 
@@ -208,14 +304,13 @@ def is_(first_value, second_value, msg=""):
     failure message
 
     """
-    __tracebackhide__ = True
     if first_value is second_value:
         return True
-    log_failure(f"check {first_value} is {second_value}", msg)
+    _log_comparison_failure(first_value, "is", second_value, msg)
     return False
 
 
-def is_not(first_value, second_value, msg=""):
+def is_not(first_value: Any, second_value: Any, msg: Any = "") -> bool:
     """
     Check if two values do not refer to the same object.
 
@@ -233,14 +328,13 @@ def is_not(first_value, second_value, msg=""):
     a failure message
 
     """
-    __tracebackhide__ = True
     if first_value is not second_value:
         return True
-    log_failure(f"check {first_value} is not {second_value}", msg)
+    _log_comparison_failure(first_value, "is not", second_value, msg)
     return False
 
 
-def is_true(value, msg=""):
+def is_true(value: Any, msg: Any = "") -> bool:
     """
     Check if a given value evaluates to True.
 
@@ -256,14 +350,13 @@ def is_true(value, msg=""):
     >>> is_true(0, "Value should be True")  # Returns False and logs a failure message
 
     """
-    __tracebackhide__ = True
     if bool(value):
         return True
     log_failure(msg)
     return False
 
 
-def is_false(value, msg=""):
+def is_false(value: Any, msg: Any = "") -> bool:
     """
     Check if a given value evaluates to False.
 
@@ -279,14 +372,13 @@ def is_false(value, msg=""):
     >>> is_false(1, "Value should be False")  # Returns False and logs a failure message
 
     """
-    __tracebackhide__ = True
     if not bool(value):
         return True
-    log_failure(f"check not bool({value})", msg)
+    log_failure(_LazyMessage(lambda v=value: f"check not bool({v})"), msg)
     return False
 
 
-def is_none(value, msg=""):
+def is_none(value: Any, msg: Any = "") -> bool:
     """
     Check if a given value is None.
 
@@ -302,14 +394,13 @@ def is_none(value, msg=""):
     >>> is_none(42, "Value should be None")  # Returns False and logs a failure message
 
     """
-    __tracebackhide__ = True
     if value is None:
         return True
-    log_failure(f"check {value} is None", msg)
+    log_failure(_LazyMessage(lambda v=value: f"check {v} is None"), msg)
     return False
 
 
-def is_not_none(value, msg=""):
+def is_not_none(value: Any, msg: Any = "") -> bool:
     """
     Check if a given value is not None.
 
@@ -325,14 +416,13 @@ def is_not_none(value, msg=""):
     >>> is_not_none(None, "Value should not be None")  # Returns False and logs a failure message
 
     """
-    __tracebackhide__ = True
     if value is not None:
         return True
-    log_failure(f"check {value} is not None", msg)
+    log_failure(_LazyMessage(lambda v=value: f"check {v} is not None"), msg)
     return False
 
 
-def is_in(value, iterable, msg=""):
+def is_in(value: Any, iterable: Any, msg: Any = "") -> bool:
     """
     Check if a value is present in a given iterable.
 
@@ -349,14 +439,13 @@ def is_in(value, iterable, msg=""):
     >>> is_in('x', 'abc', "Value should be present")  # Returns False and logs a failure message
 
     """
-    __tracebackhide__ = True
     if value in iterable:
         return True
-    log_failure(f"check {value} in {iterable}", msg)
+    log_failure(_LazyMessage(lambda v=value, it=iterable: f"check {v} in {it}"), msg)
     return False
 
 
-def is_not_in(value, iterable, msg=""):
+def is_not_in(value: Any, iterable: Any, msg: Any = "") -> bool:
     """
     Check if a value is not present in a given iterable.
 
@@ -374,14 +463,13 @@ def is_not_in(value, iterable, msg=""):
     failure message
 
     """
-    __tracebackhide__ = True
     if value not in iterable:
         return True
-    log_failure(f"check {value} not in {iterable}", msg)
+    log_failure(_LazyMessage(lambda v=value, it=iterable: f"check {v} not in {it}"), msg)
     return False
 
 
-def is_instance(value, type_to_check, msg=""):
+def is_instance(value: Any, type_to_check: Any, msg: Any = "") -> bool:
     """
     Check if a value is an instance of a specified type.
 
@@ -398,14 +486,13 @@ def is_instance(value, type_to_check, msg=""):
     >>> is_instance(42, str, "Value should be a string")  # Returns False and logs a failure message
 
     """
-    __tracebackhide__ = True
     if isinstance(value, type_to_check):
         return True
-    log_failure(f"check isinstance({value}, {type_to_check})", msg)
+    log_failure(_LazyMessage(lambda v=value, tp=type_to_check: f"check isinstance({v}, {tp})"), msg)
     return False
 
 
-def is_not_instance(value, type_to_check, msg=""):
+def is_not_instance(value: Any, type_to_check: Any, msg: Any = "") -> bool:
     """
     Check if a value is not an instance of a specified type.
 
@@ -423,14 +510,76 @@ def is_not_instance(value, type_to_check, msg=""):
     failure message
 
     """
-    __tracebackhide__ = True
     if not isinstance(value, type_to_check):
         return True
-    log_failure(f"check not isinstance({value}, {type_to_check})", msg)
+    log_failure(_LazyMessage(
+        lambda v=value, tp=type_to_check: f"check not isinstance({v}, {tp})"), msg)
     return False
 
 
-def almost_equal(first_value, second_value, rel=None, abs_tol=None, msg=""):
+# pytest.approx defaults, used by the scalar fast path of almost_equal/not_almost_equal.
+_DEFAULT_REL_TOL = 1e-6
+_DEFAULT_ABS_TOL = 1e-12
+_SCALAR_TYPES = (int, float)
+
+# pytest.approx, imported on first use so that importing this module does not import pytest.
+_approx: Callable[..., Any] | None = None
+
+
+def _get_approx() -> Callable[..., Any]:
+    """
+    Return `pytest.approx`, importing pytest the first time it is needed.
+
+    Returns:
+    - callable: The `pytest.approx` function.
+    """
+    global _approx  # pylint: disable=global-statement
+    if _approx is None:
+        from pytest import approx  # pylint: disable=import-outside-toplevel
+        _approx = approx
+    return _approx
+
+
+def _scalar_is_close(actual: Any, expected: Any, rel: Any, abs_tol: Any) -> bool:
+    """
+    Compare two plain numbers the way `actual == pytest.approx(expected, rel, abs_tol)` does.
+
+    The steps follow `ApproxScalar.__eq__`. The difference is compared directly rather than
+    through `math.isclose`, which would convert large ints to float and lose precision. For the
+    same reason the values are annotated as Any: mypyc would compile `float` (and `int | float`)
+    as a C double.
+
+    Parameters:
+    - actual: The value being checked.
+    - expected: The value `actual` is compared against.
+    - rel (optional): Relative tolerance, applied to `expected`.
+    - abs_tol (optional): Absolute tolerance.
+
+    Returns:
+    - bool: True if `actual` is within the tolerance of `expected`, False otherwise.
+    """
+    if actual == expected:
+        return True
+    # NaN is never close to anything, and infinity is only equal to itself.
+    if type(expected) is float and (math.isnan(expected) or math.isinf(expected)):
+        return False
+
+    absolute_tolerance = _DEFAULT_ABS_TOL if abs_tol is None else abs_tol
+    if rel is None and abs_tol is not None:
+        tolerance = absolute_tolerance
+        is_valid = absolute_tolerance >= 0
+    else:
+        relative_tolerance = (_DEFAULT_REL_TOL if rel is None else rel) * abs(expected)
+        tolerance = max(relative_tolerance, absolute_tolerance)
+        is_valid = absolute_tolerance >= 0 and relative_tolerance >= 0
+    if not is_valid:
+        # A negative or NaN tolerance: let pytest.approx raise its own error.
+        return actual == _get_approx()(expected, rel, abs_tol)
+    return abs(expected - actual) <= tolerance
+
+
+def almost_equal(first_value: Any, second_value: Any, rel: Any = None,
+                 abs_tol: Any = None, msg: Any = "") -> bool:
     """
     Check if two values are almost equal within the specified relative and absolute tolerances.
 
@@ -451,16 +600,21 @@ def almost_equal(first_value, second_value, rel=None, abs_tol=None, msg=""):
     Returns False and logs a failure message
 
     """
-
-    __tracebackhide__ = True
-    if first_value == pytest.approx(second_value, rel, abs_tol):
+    if type(first_value) in _SCALAR_TYPES and type(second_value) in _SCALAR_TYPES:
+        is_close = _scalar_is_close(first_value, second_value, rel, abs_tol)
+    else:
+        is_close = first_value == _get_approx()(second_value, rel, abs_tol)
+    if is_close:
         return True
-    log_failure(
-        f"check {first_value} == pytest.approx({second_value}, rel={rel}, abs_tol={abs_tol})", msg)
+    log_failure(_LazyMessage(
+        lambda fv=first_value, sv=second_value, rel=rel, abs_tol=abs_tol:
+            f"check {fv} == pytest.approx({sv}, rel={rel}, abs_tol={abs_tol})"),
+        msg)
     return False
 
 
-def not_almost_equal(first_value, second_value, rel=None, abs_tol=None, msg=""):
+def not_almost_equal(first_value: Any, second_value: Any, rel: Any = None,
+                     abs_tol: Any = None, msg: Any = "") -> bool:
     """
     Check if two values are not almost equal within the specified relative and absolute tolerances.
 
@@ -481,15 +635,20 @@ def not_almost_equal(first_value, second_value, rel=None, abs_tol=None, msg=""):
           # Returns True
 
     """
-    __tracebackhide__ = True
-    if first_value != pytest.approx(second_value, rel, abs_tol):
+    if type(first_value) in _SCALAR_TYPES and type(second_value) in _SCALAR_TYPES:
+        is_close = _scalar_is_close(first_value, second_value, rel, abs_tol)
+    else:
+        is_close = first_value == _get_approx()(second_value, rel, abs_tol)
+    if not is_close:
         return True
-    log_failure(
-        f"check {first_value} != pytest.approx({second_value}, rel={rel}, abs_tol={abs_tol})", msg)
+    log_failure(_LazyMessage(
+        lambda fv=first_value, sv=second_value, rel=rel, abs_tol=abs_tol:
+            f"check {fv} != pytest.approx({sv}, rel={rel}, abs_tol={abs_tol})"),
+        msg)
     return False
 
 
-def greater(first_value, second_value, msg=""):
+def greater(first_value: Any, second_value: Any, msg: Any = "") -> bool:
     """
     Check if the first value is greater than the second.
 
@@ -506,14 +665,13 @@ def greater(first_value, second_value, msg=""):
     >>> greater(2, 3, msg="Value should be greater")  # Returns False and logs a failure message
 
     """
-    __tracebackhide__ = True
     if first_value > second_value:
         return True
-    log_failure(f"check {first_value} > {second_value}", msg)
+    _log_comparison_failure(first_value, ">", second_value, msg)
     return False
 
 
-def greater_equal(first_value, second_value, msg=""):
+def greater_equal(first_value: Any, second_value: Any, msg: Any = "") -> bool:
     """
     Check if the first value is greater than or equal to the second.
 
@@ -531,14 +689,13 @@ def greater_equal(first_value, second_value, msg=""):
     failure message
 
     """
-    __tracebackhide__ = True
     if first_value >= second_value:
         return True
-    log_failure(f"check {first_value} >= {second_value}", msg)
+    _log_comparison_failure(first_value, ">=", second_value, msg)
     return False
 
 
-def less(first_value, second_value, msg=""):
+def less(first_value: Any, second_value: Any, msg: Any = "") -> bool:
     """
     Check if the first value is less than the second.
 
@@ -555,14 +712,13 @@ def less(first_value, second_value, msg=""):
     >>> less(3, 2, msg="Value should be less")  # Returns False and logs a failure message
 
     """
-    __tracebackhide__ = True
     if first_value < second_value:
         return True
-    log_failure(f"check {first_value} < {second_value}", msg)
+    _log_comparison_failure(first_value, "<", second_value, msg)
     return False
 
 
-def less_equal(first_value, second_value, msg=""):
+def less_equal(first_value: Any, second_value: Any, msg: Any = "") -> bool:
     """
     Check if the first value is less than or equal to the second.
 
@@ -580,15 +736,23 @@ def less_equal(first_value, second_value, msg=""):
     message
 
     """
-    __tracebackhide__ = True
     if first_value <= second_value:
         return True
-    log_failure(f"check {first_value} <= {second_value}", msg)
+    _log_comparison_failure(first_value, "<=", second_value, msg)
     return False
 
 
-def between(value_to_check, lower_bound, upper_bound, msg="", lower_bound_included=False, \
-            upper_bound_included=False):
+# Failure message formats, indexed by (lower_bound_included << 1) | upper_bound_included.
+_BETWEEN_FORMATS = (
+    "check {} < {} < {}",
+    "check {} < {} <= {}",
+    "check {} <= {} < {}",
+    "check {} <= {} <= {}",
+)
+
+
+def between(value_to_check: Any, lower_bound: Any, upper_bound: Any, msg: Any = "", \
+            lower_bound_included: Any = False, upper_bound_included: Any = False) -> bool:
     """
     Check if a value is between two other values.
 
@@ -610,27 +774,21 @@ def between(value_to_check, lower_bound, upper_bound, msg="", lower_bound_includ
     >>> between(5, 2, 4)  # Returns False and logs a failure message
 
     """
-    __tracebackhide__ = True
-    if lower_bound_included and upper_bound_included:
-        if lower_bound <= value_to_check <= upper_bound:
-            return True
-        log_failure(
-            f"check {lower_bound} <= {value_to_check} <= {upper_bound}", msg)
-        return False
+    # The comparisons stay inline: a table of comparison functions costs more on the passing path
+    # than the branches it replaces. Only the failure message is looked up by index.
     if lower_bound_included:
-        if lower_bound <= value_to_check < upper_bound:
+        if upper_bound_included:
+            if lower_bound <= value_to_check <= upper_bound:
+                return True
+        elif lower_bound <= value_to_check < upper_bound:
             return True
-        log_failure(
-            f"check {lower_bound} <= {value_to_check} < {upper_bound}", msg)
-        return False
-    if upper_bound_included:
+    elif upper_bound_included:
         if lower_bound < value_to_check <= upper_bound:
             return True
-        log_failure(
-            f"check {lower_bound} < {value_to_check} <= {upper_bound}", msg)
-        return False
-    if lower_bound < value_to_check < upper_bound:
+    elif lower_bound < value_to_check < upper_bound:
         return True
-    log_failure(
-        f"check {lower_bound} < {value_to_check} < {upper_bound}", msg)
+    fmt = _BETWEEN_FORMATS[(bool(lower_bound_included) << 1) | bool(upper_bound_included)]
+    log_failure(_LazyMessage(
+        lambda lo=lower_bound, v=value_to_check, up=upper_bound, fmt=fmt: fmt.format(lo, v, up)),
+        msg)
     return False
@@ -34,33 +34,160 @@ else:
     print("Test run completed successfully.")
 
 """
-SHOULD_USE_COLOR = False
+import itertools
+from typing import Any, Callable
+
 COLOR_RED = "\x1b[31m"
 COLOR_RESET = "\x1b[0m"
-_STOP_ON_FAIL = False
 
-_DEFAULT_MAX_FAIL = None
-_DEFAULT_MAX_REPORT = None
-_DEFAULT_MAX_TB = None
 
-_MAX_FAIL = None
-_MAX_REPORT = None
-_MAX_TB = None
-_NUM_FAILURES = 0
+class _Config:
+    """
+    Session-wide settings, filled in once by the pytest plugin in `pytest_configure`.
+
+    Attributes:
+    - max_fail (int): Default maximum number of failures per test.
+    - max_report (int): Default maximum number of failures to report per test.
+    - max_tb (int): Default maximum number of pseudo-tracebacks per test.
+    """
+
+    __slots__ = ("max_fail", "max_report", "max_tb")
+
+    # Any for the same reason as the `_State` limits below.
+    max_fail: Any
+    max_report: Any
+    max_tb: Any
+
+    def __init__(self) -> None:
+        """
+        Initialize the settings with no limits.
+
+        Returns:
+        - None
+        """
+        self.max_fail = None
+        self.max_report = None
+        self.max_tb = None
+
+
+CONFIG = _Config()
+
+
+class _State:
+    """
+    Mutable state shared by the soft check functions.
+
+    Keeping the state on a slotted instance lets `log_failure` read it through a single local
+    instead of a module-level global lookup per value.
+
+    Attributes:
+    - counter (itertools.count): Numbers the failures, starting at 1. `next()` on it is a single
+      C call, so concurrent failures never share a number.
+    - has_failures (bool): Whether any failure was logged.
+    - max_fail (int): Maximum number of failures before raising an assertion.
+    - max_report (int): Maximum number of failures to report.
+    - max_tb (int): Maximum number of pseudo-tracebacks.
+    - num_tracebacks (int): Number of pseudo-tracebacks captured so far.
+    - failures (list): List to store failure messages.
+    - stop_on_fail (bool): Whether to stop on the first failure.
+    - use_color (bool): Whether to color failure messages.
+    """
+
+    __slots__ = (
+        "counter",
+        "has_failures",
+        "max_fail",
+        "max_report",
+        "max_tb",
+        "num_tracebacks",
+        "failures",
+        "stop_on_fail",
+        "use_color",
+    )
+
+    counter: "itertools.count[int]"
+    has_failures: bool
+    # The limits are also set from user code (e.g. `check.set_max_report(2.0)`), and a mypyc
+    # build enforces attribute annotations, so they are not narrowed to int | None.
+    max_fail: Any
+    max_report: Any
+    max_tb: Any
+    num_tracebacks: int
+    failures: list[str]
+    stop_on_fail: bool
+    use_color: bool
+
+    def __init__(self) -> None:
+        """
+        Initialize the state with no failures and the default limits.
+
+        Returns:
+        - None
+        """
+        self.counter = itertools.count(1)
+        self.has_failures = False
+        self.max_fail = CONFIG.max_fail
+        self.max_report = CONFIG.max_report
+        self.max_tb = CONFIG.max_tb
+        self.num_tracebacks = 0
+        self.failures = []
+        self.stop_on_fail = False
+        self.use_color = False
+
+
+_state = _State()
+
+
+class _LazyMessage:
+    """
+    A failure message that is only built if the failure is going to be reported.
+
+    `log_failure` converts its message with `str()`, which is what calls `build`. Messages passed
+    in by users are never wrapped, so a callable user message is logged as `str(msg)`.
+
+    Attributes:
+    - build (callable): Zero-argument callable returning the message.
+    """
+
+    __slots__ = ("build",)
+
+    build: Callable[..., Any]
+
+    def __init__(self, build: Callable[..., Any]) -> None:
+        """
+        Initialize the message.
+
+        Args:
+        - build (callable): Zero-argument callable returning the message.
 
-_failures = []
+        Returns:
+        - None
+        """
+        self.build = build
 
-def clear_failures():
+    def __str__(self) -> str:
+        """
+        Build the message.
+
+        Returns:
+        - str: The message returned by `build`, converted with `str()`.
+        """
+        return str(self.build())
+
+
+def clear_failures() -> None:
     """
     Clear the stored failures and reset the maximum failure count and reporting limits.
     """
-    global _failures, _NUM_FAILURES
-    global _MAX_FAIL, _MAX_REPORT, _MAX_TB
-    _failures = []
-    _NUM_FAILURES = 0
-    _MAX_FAIL = _DEFAULT_MAX_FAIL
-    _MAX_REPORT = _DEFAULT_MAX_REPORT
-    _MAX_TB = _DEFAULT_MAX_TB
+    state = _state
+    config = CONFIG
+    state.failures = []
+    state.counter = itertools.count(1)
+    state.has_failures = False
+    state.max_fail = config.max_fail
+    state.max_report = config.max_report
+    state.max_tb = config.max_tb
+    state.num_tracebacks = 0
 
 
 def any_failures() -> bool:
@@ -70,55 +197,57 @@ def any_failures() -> bool:
     Returns:
     - bool: True if there are failures, False otherwise.
     """
-    return bool(get_failures())
+    return _state.has_failures
 
 
-def get_failures():
+def get_failures() -> list[str]:
     """
     Get the list of stored failures.
 
     Returns:
     - list: A list of failure messages.
     """
-    return _failures
+    return _state.failures
 
 
-def log_failure(msg="", check_str=""):
+def log_failure(msg: Any = "", check_str: Any = "") -> None:
     """
     Log a failure message.
 
     Args:
-    - msg (str): The main failure message.
+    - msg (str or _LazyMessage): The main failure message. A `_LazyMessage` is only built if the
+      failure is going to be reported.
     - check_str (str): Additional information about the check.
 
-    Global Variables:
-    - _NUM_FAILURES (int): Counter for the number of failures.
-    - _MAX_REPORT (int): Maximum number of failures to report.
-    - _MAX_FAIL (int): Maximum number of failures before raising an assertion.
-    - _failures (list): List to store failure messages.
-    - _STOP_ON_FAIL (bool): Whether to stop on the first failure.
+    The failure count, limits and stored messages are read from and written to `_state`.
 
     Returns:
     - None
     """
-    global _NUM_FAILURES
     __tracebackhide__ = True
-    _NUM_FAILURES += 1
-
-    msg = str(msg).strip()
-
-    if check_str:
-        msg = f"{msg}: {check_str}"
-
-    if (_MAX_REPORT is None) or (_NUM_FAILURES <= _MAX_REPORT):
-
-        if SHOULD_USE_COLOR:
+    state = _state
+    num_failures = next(state.counter)
+    state.has_failures = True
+    max_report = state.max_report
+
+    # Only the first max_report failures are kept. This is checked here rather than delegated to
+    # a bounded deque, which would keep the last failures instead and could not skip building
+    # the message.
+    if (max_report is None) or (num_failures <= max_report):
+        # The message is only built once we know it will be stored.
+        msg = str(msg).strip()
+
+        if check_str:
+            msg = f"{msg}: {check_str}"
+
+        if state.use_color:
             msg = f"{COLOR_RED}{msg}{COLOR_RESET}"
-        _failures.append(msg)
+        state.failures.append(msg)
 
-    if _MAX_FAIL and (_NUM_FAILURES >= _MAX_FAIL):
-        assert_msg = f"pytest-check max fail of {_NUM_FAILURES} reached"
-        assert _NUM_FAILURES < _MAX_FAIL, assert_msg
+    max_fail = state.max_fail
+    if max_fail and (num_failures >= max_fail):
+        assert_msg = f"pytest-check max fail of {num_failures} reached"
+        assert num_failures < max_fail, assert_msg
 
-    if _STOP_ON_FAIL:
+    if state.stop_on_fail:
         assert False, "Stopping on first failure"
@@ -35,9 +35,33 @@ with CheckRaisesContext(ValueError, TypeError, custom_message="Either ValueError
 # This will raise an AssertionError if neither ValueError nor TypeError is raised within the 'with'\
  block.
 """
+import functools
+
 from .check_log import log_failure
 
-_STOP_ON_FAIL = False
+
+@functools.lru_cache(maxsize=256)
+def _normalize_excs(expected_exception):
+    """
+    Normalize and validate the expected exception argument of `raises`.
+
+    The result is cached, so each distinct set of exceptions is only normalized and validated once.
+
+    Args:
+    - expected_exception (type or tuple): Expected exception type or a tuple of types.
+
+    Returns:
+    - tuple: Tuple of expected exception types.
+    """
+    if isinstance(expected_exception, tuple):
+        expected_excs = expected_exception
+    else:
+        expected_excs = (expected_exception,)
+    assert all(
+        isinstance(exc, type) and issubclass(exc, BaseException)
+        for exc in expected_excs
+    )
+    return expected_excs
 
 
 def raises(expected_exception, *args, **kwargs):
@@ -62,23 +86,15 @@ def raises(expected_exception, *args, **kwargs):
     """
     __tracebackhide__ = True
 
-    if isinstance(expected_exception, type):
-        excepted_exceptions = (expected_exception,)
-    else:
-        excepted_exceptions = expected_exception
-
-    assert all(
-        isinstance(exc, type) or issubclass(exc, BaseException)
-        for exc in excepted_exceptions
-    )
+    expected_excs = _normalize_excs(expected_exception)
 
     msg = kwargs.pop("msg", None)
     if not args:
         assert not kwargs, f"Unexpected kwargs for soft_check.raises: {kwargs}"
-        return CheckRaisesContext(expected_exception, msg=msg)
+        return CheckRaisesContext(*expected_excs, msg=msg)
     func = args[0]
     assert callable(func)
-    with CheckRaisesContext(expected_exception, msg=msg):
+    with CheckRaisesContext(*expected_excs, msg=msg):
         func(*args[1:], **kwargs)
     return None
 
@@ -97,13 +113,15 @@ class CheckRaisesContext:
         # Your code that should raise MyException
     ```
 
-    Global Variables:
-    - _STOP_ON_FAIL (bool): Whether to stop on the first failure.
+    Under stop-on-fail, `log_failure` raises on the first failure, so a missing or unexpected
+    exception still fails the test.
 
     Returns:
     - None
     """
 
+    __slots__ = ("expected_excs", "msg")
+
     def __init__(self, *expected_excs, msg=None):
         """
         Initialize the context manager.
@@ -137,13 +155,11 @@ class CheckRaisesContext:
         - exc_tb (traceback): The traceback object.
 
         Returns:
-        - bool: True if the exception matches the expected type, False otherwise.
+        - bool: True, so the exception is suppressed once it is matched or logged as a failure.
         """
         __tracebackhide__ = True
         if exc_type is not None and issubclass(exc_type, self.expected_excs):
             return True
 
-        if not _STOP_ON_FAIL:
-            log_failure(self.msg if self.msg else exc_val)
-            return True
-        return False
+        log_failure(self.msg if self.msg else exc_val)
+        return True
@@ -12,20 +12,99 @@ with context_manager as c:
     c.set_max_fail(5)  # Set max failures limit
     c.set_max_report(10)  # Set max reported failures limit
     c.set_max_tb(3)  # Set max traceback limit
+    c.configure(max_fail=5, max_report=10, max_tb=3)  # Or set them all at once
 Classes:
 
 CheckContextManager: Context manager for soft checks in pytest.
 Functions:
 
 check_log.log_failure: Log a failure message.
-Attributes:
 
-_STOP_ON_FAIL (bool): Global variable to stop execution on failure (default: False).
+The stop-on-fail setting (`-x` / `--maxfail=1`) and the limits live on the shared
+`check_log` state, which is bound here once; it is reset in place and never replaced.
 """
-from . import check_log
-from .check_log import log_failure
+from .check_log import _LazyMessage, _state, log_failure
 
-_STOP_ON_FAIL = False
+
+def _log_block_failure(exc_type, exc_val, msg):
+    """
+    Log the exception that ended a `with check` block, if it is a soft check failure.
+
+    Args:
+    - exc_type (type): Type of the raised exception, not None.
+    - exc_val (Exception): The exception instance.
+    - msg (str): Custom message given to `check(msg)`, or None.
+
+    Returns:
+    - bool: True if the failure was logged and the exception should be suppressed, else None.
+    """
+    __tracebackhide__ = True
+    # Plain AssertionError is by far the common case; skip issubclass for it.
+    if exc_type is not AssertionError and not issubclass(exc_type, AssertionError):
+        return None
+    if _state.stop_on_fail:
+        return None
+    if msg is None:
+        log_failure(exc_val)
+    else:
+        # Only formatted if the failure is reported, see `log_failure`.
+        log_failure(_LazyMessage(lambda msg=msg, exc_val=exc_val: f"{msg}\n{exc_val}"))
+    return True
+
+
+class _MessageCheck:
+    """
+    Context manager for a single `with check(msg)` block.
+
+    Args:
+    - check (CheckContextManager): The instance `check(msg)` was called on.
+    - msg (str): Custom message to log on failure.
+
+    Returns:
+    - None
+    """
+
+    __slots__ = ("check", "msg")
+
+    def __init__(self, check, msg):
+        """
+        Initialize the context manager.
+
+        Args:
+        - check (CheckContextManager): The instance `check(msg)` was called on.
+        - msg (str): Custom message to log on failure.
+
+        Returns:
+        - None
+        """
+        self.check = check
+        self.msg = msg
+
+    def __enter__(self):
+        """
+        Enter the context.
+
+        Returns:
+        - CheckContextManager: The instance `check(msg)` was called on, with the check functions.
+        """
+        return self.check
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Exit the context.
+
+        Args:
+        - exc_type (type): Type of the raised exception.
+        - exc_val (Exception): The exception instance.
+        - exc_tb (traceback): The traceback object.
+
+        Returns:
+        - bool: True if the failure was logged with the message, None otherwise.
+        """
+        __tracebackhide__ = True
+        if exc_type is None:
+            return None
+        return _log_block_failure(exc_type, exc_val, self.msg)
 
 
 class CheckContextManager:
@@ -39,20 +118,16 @@ class CheckContextManager:
         check.set_max_fail(5)  # Set max failures limit
         check.set_max_report(10)  # Set max reported failures limit
         check.set_max_tb(3)  # Set max traceback limit
+        check.configure(max_fail=5, max_report=10, max_tb=3)  # Or set them all at once
     ```
 
+    The instance holds no per-block state: `check(msg)` returns a separate `_MessageCheck` that
+    carries the message, so a single shared instance can be used from several threads and in
+    nested `with` blocks.
+
     Returns:
     - CheckContextManager: The context manager instance.
     """
-    def __init__(self):
-        """
-        Initialize the context manager.
-
-        Returns:
-        - None
-        """
-        self.msg = None
-
     def __enter__(self):
         """
         Enter the context.
@@ -75,18 +150,9 @@ class CheckContextManager:
         - bool: True if the exception matches the expected type, False otherwise.
         """
         __tracebackhide__ = True
-        if exc_type is not None and issubclass(exc_type, AssertionError):
-            if _STOP_ON_FAIL:
-                self.msg = None
-                return None
-            if self.msg is not None:
-                log_failure(f"{self.msg}\n{exc_val}")
-            else:
-                log_failure(exc_val)
-            self.msg = None
-            return True
-        self.msg = None
-        return None
+        if exc_type is None:
+            return None
+        return _log_block_failure(exc_type, exc_val, None)
 
     def __call__(self, msg=None):
         """
@@ -96,10 +162,12 @@ class CheckContextManager:
         - msg (str): Custom message to log on failure.
 
         Returns:
-        - CheckContextManager: The context manager instance.
+        - _MessageCheck or CheckContextManager: A context manager for one block that logs `msg`
+          with its failure, or this instance if no message is given.
         """
-        self.msg = msg
-        return self
+        if msg is None:
+            return self
+        return _MessageCheck(self, msg)
 
     def set_max_fail(self, max_failures):
         """
@@ -111,7 +179,7 @@ class CheckContextManager:
         Returns:
         - None
         """
-        check_log._MAX_FAIL = max_failures
+        _state.max_fail = max_failures
 
     def set_max_report(self, max_reported_failures):
         """
@@ -123,7 +191,7 @@ class CheckContextManager:
         Returns:
         - None
         """
-        check_log._MAX_REPORT = max_reported_failures
+        _state.max_report = max_reported_failures
 
     def set_max_tb(self, max_tb_limit):
         """
@@ -135,6 +203,26 @@ class CheckContextManager:
         Returns:
         - None
         """
-        check_log._MAX_TB = max_tb_limit
+        _state.max_tb = max_tb_limit
+
+    def configure(self, *, max_fail=None, max_report=None, max_tb=None):
+        """
+        Set several limits in one call. Limits that are not given (None) are left unchanged.
+
+        Args:
+        - max_fail (int): Maximum allowed failures.
+        - max_report (int): Maximum allowed reported failures.
+        - max_tb (int): Maximum allowed traceback limit.
+
+        Returns:
+        - None
+        """
+        state = _state
+        if max_fail is not None:
+            state.max_fail = max_fail
+        if max_report is not None:
+            state.max_report = max_report
+        if max_tb is not None:
+            state.max_tb = max_tb
 
 check = CheckContextManager()
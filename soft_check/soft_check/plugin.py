@@ -1,11 +1,13 @@
 import sys
-import warnings
+import types
 
 import pytest
-from _pytest._code.code import ExceptionInfo
-from _pytest.skipping import xfailed_key
 
-from soft_check import check_log, check_raises, context_manager, pseudo_traceback
+from soft_check import check_log, context_manager
+
+# Bound once, as the report hook runs for every test phase.
+_get_failures = check_log.get_failures
+_clear_failures = check_log.clear_failures
 
 
 @pytest.hookimpl(trylast=True, hookwrapper=True)
@@ -21,26 +23,36 @@ def pytest_runtest_makereport(item, call):
     - None
     """
     outcome = yield
-    report = outcome.get_result()
-
-    failures = check_log.get_failures()
-    check_log.clear_failures()
 
-    if failures:
-        longrepr = ["\n".join(failures)]
-        report.longrepr = "\n".join(longrepr)
+    # The limits and counters are reset after every phase, even when nothing failed.
+    failures = _get_failures()
+    _clear_failures()
+    if not failures:
+        return
 
-        if item._store[xfailed_key]:
-            report.outcome = "skipped"
-            report.wasxfail = item._store[xfailed_key].reason
-        else:
-            report.outcome = "failed"
+    # pylint: disable=import-outside-toplevel
+    from _pytest._code.code import ExceptionInfo
+    from _pytest.skipping import xfailed_key
 
-        try:
-            raise AssertionError(report.longrepr)
-        except AssertionError:
-            excinfo = ExceptionInfo.from_current()
-        call.excinfo = excinfo
+    report = outcome.get_result()
+    report.longrepr = "\n".join(failures)
+
+    # `stash` replaced `_store` in pytest 7.
+    store = item.stash if hasattr(item, "stash") else item._store
+    xfailed = store.get(xfailed_key, None)
+    if xfailed:
+        report.outcome = "skipped"
+        report.wasxfail = xfailed.reason
+    else:
+        report.outcome = "failed"
+
+    # Keep the exception of a phase that already raised, so e.g. --pdb still sees the real error.
+    if call.excinfo is None:
+        # Attach a traceback for this frame by hand instead of raising and catching the error.
+        exc = AssertionError(report.longrepr)
+        frame = sys._getframe()
+        exc_tb = types.TracebackType(None, frame, frame.f_lasti, frame.f_lineno)
+        call.excinfo = ExceptionInfo.from_exc_info((AssertionError, exc, exc_tb))
 
 def pytest_configure(config):
     """
@@ -55,31 +67,30 @@ def pytest_configure(config):
     # Add some red to the failure output, if stdout can accommodate it.
     isatty = sys.stdout.isatty()
     color = config.option.color
-    check_log.should_use_color = (isatty and color == "auto") or (color == "yes")
+    check_log._state.use_color = (isatty and color == "auto") or (color == "yes")
 
     # If -x or --maxfail=1, then stop on the first failed check
     # Otherwise, let pytest stop on the maxfail-th test function failure
     maxfail = config.getvalue("maxfail")
     stop_on_fail = maxfail == 1
 
-    context_manager._stop_on_fail = stop_on_fail
-    check_raises._stop_on_fail = stop_on_fail
-    check_log._stop_on_fail = stop_on_fail
+    check_log._state.stop_on_fail = stop_on_fail
+
+    # Grab options
+    # --check-no-tb stores 0 into the same destination as --check-max-tb.
+    max_tb = config.getoption("--check-max-tb")
 
     # Allow for --tb=no to turn off check's pseudo tbs
     traceback_style = config.getvalue("tbstyle")
-    pseudo_traceback._traceback_style = traceback_style
-
-    # Grab options
-    check_log._default_max_fail = config.getoption("--check-max-fail")
-    check_log._default_max_report = config.getoption("--check-max-report")
-    check_log._default_max_tb = config.getoption("--check-max-tb")
-    no_tb = config.getoption("--check-no-tb")
-    if no_tb:
-        warnings.warn(
-            "--check-no-tb is deprecated; use --check-max-tb=0", DeprecationWarning
-        )
-        check_log._default_max_tb = 0
+    if traceback_style == "no":
+        max_tb = 0
+
+    check_config = check_log.CONFIG
+    check_config.max_fail = config.getoption("--check-max-fail")
+    check_config.max_report = config.getoption("--check-max-report")
+    check_config.max_tb = max_tb
+    # Apply the new defaults to checks made before the first test report.
+    check_log.clear_failures()
 
 @pytest.fixture(name="check")
 def check_fixture():
@@ -99,16 +110,11 @@ def pytest_addoption(parser):
     - parser: The pytest parser object.
 
     Options:
-    - "--check-no-tb": Turn off pseudo-tracebacks.
+    - "--check-no-tb": Turn off pseudo-tracebacks (deprecated alias for --check-max-tb=0).
     - "--check-max-report": Set the maximum failures to report.
     - "--check-max-fail": Set the maximum failures per test.
     - "--check-max-tb": Set the maximum pseudo-tracebacks per test.
     """
-    parser.addoption(
-        "--check-no-tb",
-        action="store_true",
-        help="turn off pseudo-tracebacks",
-    )
     parser.addoption(
         "--check-max-report",
         action="store",
@@ -128,3 +134,11 @@ def pytest_addoption(parser):
         default=1,
         help="max pseudo-tracebacks per test",
     )
+    # Registered after --check-max-tb so that option's default applies to the shared destination.
+    parser.addoption(
+        "--check-no-tb",
+        action="store_const",
+        const=0,
+        dest="check_max_tb",
+        help="turn off pseudo-tracebacks (deprecated, use --check-max-tb=0)",
+    )
@@ -1,21 +1,88 @@
-import inspect
+import functools
+import linecache
 import os
+import sys
+
+from soft_check import check_log
+
+# Returned instead of a context once no more pseudo-tracebacks should be captured.
+_NO_CONTEXT = ("", 0, "", "")
+
+# Display path for each source filename, relative to _RELPATH_CWD, see `_display_path`.
+_RELPATH_CACHE: dict[str, str] = {}
+_RELPATH_CWD = None
+
+
+def _display_path(filename):
+    """
+    Get the path of a source file relative to the current directory, or absolute if it has none.
+
+    Results are cached per filename, and the cache is dropped whenever the current directory
+    changes (e.g. a test using `monkeypatch.chdir`).
+
+    Args:
+    - filename (str): The source filename.
+
+    Returns:
+    - str: The path to display for the file.
+    """
+    global _RELPATH_CWD  # pylint: disable=global-statement
+    cwd = os.getcwd()
+    if cwd != _RELPATH_CWD:
+        _RELPATH_CACHE.clear()
+        _RELPATH_CWD = cwd
+    try:
+        return _RELPATH_CACHE[filename]
+    except KeyError:
+        pass
+    try:
+        path = os.path.relpath(filename, cwd)
+    except ValueError:
+        path = os.path.abspath(filename)
+    _RELPATH_CACHE[filename] = path
+    return path
+
+
+@functools.lru_cache(maxsize=2048)
+def _source_line(filename, lineno):
+    """
+    Get a stripped source line, cached as the same check lines come up again and again.
+
+    Args:
+    - filename (str): The source filename.
+    - lineno (int): The line number.
+
+    Returns:
+    - str: The source line without surrounding whitespace, or "" if it is not available.
+    """
+    return linecache.getline(filename, lineno).strip()
 
 
 def get_full_context(level):
     """
     Get the full context information at a specified call stack level.
 
+    Nothing is captured once the maximum number of pseudo-tracebacks for the current test
+    (`--check-max-tb`) has been reached, so `--check-max-tb=0` makes this free.
+
     Args:
     - level (int): The call stack level.
 
     Returns:
-    - Tuple[str, int, str, str]: A tuple containing filename, line number, function name, and context.
+    - Tuple[str, int, str, str]: A tuple containing filename, line number, function name, and context,
+      or `("", 0, "", "")` if the pseudo-traceback limit has been reached.
     """
-    (_, filename, line, funcname, contextlist) = inspect.stack()[level][0:5]
-    try:
-        filename = os.path.relpath(filename)
-    except ValueError:
-        filename = os.path.abspath(filename)
-    context = contextlist[0].strip() if contextlist else ""
-    return (filename, line, funcname, context)
+    state = check_log._state
+    if state.max_tb is not None:
+        if state.num_tracebacks >= state.max_tb:
+            return _NO_CONTEXT
+        state.num_tracebacks += 1
+
+    # Only the requested frame is looked at, instead of building the whole stack with
+    # inspect.stack(), which reads the source of every frame.
+    frame = sys._getframe(level)  # pylint: disable=protected-access
+    code = frame.f_code
+    filename = code.co_filename
+    line = frame.f_lineno
+    context = _source_line(filename, line)
+    return (_display_path(filename), line, code.co_name, context)
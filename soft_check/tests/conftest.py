@@ -0,0 +1,23 @@
+import os
+
+import pytest
+
+pytest_plugins = ["pytester"]
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def run_with_plugin(pytester, monkeypatch):
+    """
+    Run pytest in a subprocess with the soft_check plugin loaded.
+
+    Returns:
+    - callable: Takes the pytest arguments and returns the `RunResult`.
+    """
+    monkeypatch.setenv("PYTHONPATH", PACKAGE_ROOT)
+
+    def run(*args):
+        return pytester.runpytest_subprocess("-p", "soft_check.plugin", *args)
+
+    return run
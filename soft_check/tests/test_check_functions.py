@@ -0,0 +1,194 @@
+import inspect
+import math
+from unittest import mock
+
+import pytest
+
+from soft_check import check, check_functions, check_log
+
+
+@pytest.fixture(autouse=True)
+def clear_failures():
+    check_log.clear_failures()
+    yield
+    check_log.clear_failures()
+
+
+@pytest.mark.parametrize(
+    ("call", "expected"),
+    [
+        (lambda: check_functions.is_true(False, None), "None"),
+        (lambda: check_functions.equal(1, 2, 5), "check 1 == 2: 5"),
+        (lambda: check_functions.greater(1, 2, ["x"]), "check 1 > 2: ['x']"),
+        (lambda: check_functions.almost_equal(1, 2, msg=3.5),
+         "check 1 == pytest.approx(2, rel=None, abs_tol=None): 3.5"),
+    ],
+)
+def test_non_str_msg_is_logged(call, expected):
+    assert call() is False
+    assert check_log.get_failures() == [expected]
+
+
+def test_between_accepts_non_bool_flags():
+    assert check_functions.between(1, 1, 4, lower_bound_included=1) is True
+    assert check_functions.between(5, 1, 4, lower_bound_included=1, upper_bound_included=0) is False
+    assert check_log.get_failures() == ["check 1 <= 5 < 4"]
+
+
+
+def test_limits_accept_non_int():
+    check.set_max_report(2.0)
+    for value in range(3):
+        check_functions.equal(value, -1)
+    assert check_log.get_failures() == ["check 0 == -1", "check 1 == -1"]
+
+
+def test_assert_equal_shows_compared_values(pytester, run_with_plugin):
+    pytester.makepyfile(
+        """
+        from soft_check import check
+
+        def test_assert_equal():
+            check.assert_equal(1, 2, "boom")
+        """
+    )
+    result = run_with_plugin()
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["E *AssertionError: boom", "E *assert 1 == 2"])
+
+@pytest.mark.parametrize(
+    ("first_value", "second_value", "rel", "abs_tol"),
+    [
+        (2**53 + 1, 2**53, 0, 0),
+        (10**20 + 1, 10**20, 0, 0),
+        (-1, 2**53, 1, None),
+        (1.0, math.inf, 1, None),
+        (math.nan, math.nan, None, None),
+        (1.0, 1.1, 0.1, None),
+        (1.0, 1.2, 0.1, 0.05),
+        (3, 3.0000000001, None, None),
+        (0.1 + 0.2, 0.3, None, None),
+    ],
+)
+def test_almost_equal_matches_pytest_approx(first_value, second_value, rel, abs_tol):
+    expected = first_value == pytest.approx(second_value, rel, abs_tol)
+    assert check_functions.almost_equal(first_value, second_value, rel, abs_tol) is expected
+    assert check_functions.not_almost_equal(first_value, second_value, rel, abs_tol) is not expected
+
+
+def test_almost_equal_rejects_negative_tolerance():
+    with pytest.raises(ValueError):
+        check_functions.almost_equal(1, 2, abs_tol=-1)
+
+
+@pytest.mark.parametrize(
+    ("lower_bound_included", "upper_bound_included", "passing", "failure"),
+    [
+        (False, False, 3, "check 2 < 2 < 4"),
+        (False, True, 4, "check 2 < 2 <= 4"),
+        (True, False, 2, "check 2 <= 4 < 4"),
+        (True, True, 4, "check 2 <= 5 <= 4"),
+    ],
+)
+def test_between_bounds(lower_bound_included, upper_bound_included, passing, failure):
+    kwargs = {
+        "lower_bound_included": lower_bound_included,
+        "upper_bound_included": upper_bound_included,
+    }
+    failing = int(failure.split()[3])
+    assert check_functions.between(passing, 2, 4, **kwargs) is True
+    assert check_functions.between(failing, 2, 4, **kwargs) is False
+    assert check_log.get_failures() == [failure]
+
+
+def _wrapper_params(wrapper):
+    return str(inspect.signature(wrapper, follow_wrapped=False))
+
+
+@pytest.mark.parametrize(
+    ("source", "params"),
+    [
+        ("def func(a, b, /, c):\n    assert a + b == c", "(a, b, /, c)"),
+        ("def func(a, *, b, c=3):\n    assert a + b == c", "(a, *, b, c=3)"),
+        ("def func(a, b=2):\n    assert a + b == 3", "(a, b=2)"),
+        ("def func(a, *args, b=2, **kw):\n    assert a + sum(args) == b",
+         "(a, *args, b=2, **kw)"),
+    ],
+)
+def test_check_func_specialized_signature(source, params):
+    namespace = {}
+    exec(source, namespace)  # pylint: disable=exec-used
+    func = namespace["func"]
+    wrapper = check_functions.check_func(func)
+    assert _wrapper_params(wrapper) == params
+    assert wrapper.__wrapped__ is func
+    assert str(inspect.signature(wrapper)) == str(inspect.signature(func))
+
+
+def test_check_func_calls_specialized_wrapper():
+    @check_functions.check_func
+    def func(a, b, /, c=0, *args, d, e=5, **kw):
+        assert (a, b, c, args, d, e, kw) == (1, 2, 3, (4,), 5, 6, {"f": 7})
+
+    assert func(1, 2, 3, 4, d=5, e=6, f=7) is True
+    assert func(1, 2, d=5) is False
+    assert len(check_log.get_failures()) == 1
+    with pytest.raises(TypeError):
+        func(1, b=2, d=5)  # pylint: disable=unexpected-keyword-arg
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "def func(_private):\n    assert _private",
+        "def func(log_failure):\n    assert log_failure",
+    ],
+)
+def test_check_func_falls_back_to_generic_wrapper(source):
+    namespace = {}
+    exec(source, namespace)  # pylint: disable=exec-used
+    assert check_functions._make_specialized_wrapper(namespace["func"]) is None
+    wrapper = check_functions.check_func(namespace["func"])
+    assert wrapper(1) is True
+    assert wrapper(0) is False
+    assert len(check_log.get_failures()) == 1
+
+
+def test_check_func_without_signature():
+    assert check_functions._make_specialized_wrapper(max) is None
+    wrapper = check_functions.check_func(max)
+    assert wrapper(1, 2) is True
+
+
+def test_check_func_on_decorated_function():
+    @check_functions.check_func
+    @mock.patch("os.getpid")
+    def func(mock_pid):
+        assert isinstance(mock_pid, mock.MagicMock)
+
+    assert func() is True
+
+
+def test_check_func_shares_default_objects():
+    default = []
+
+    @check_functions.check_func
+    def func(items=default):
+        items.append(1)
+
+    assert func() is True
+    assert default == [1]
+
+
+class _CallableMessage:
+    def __call__(self):
+        return "called!"
+
+    def __str__(self):
+        return "not called"
+
+
+def test_callable_msg_is_not_called():
+    assert check_functions.is_true(False, _CallableMessage()) is False
+    assert check_functions.equal(1, 2, _CallableMessage()) is False
+    assert check_log.get_failures() == ["not called", "check 1 == 2: not called"]
@@ -0,0 +1,71 @@
+import pytest
+
+
+@pytest.mark.parametrize("args", [(), ("-x",)])
+def test_raises_without_exception_fails(pytester, run_with_plugin, args):
+    pytester.makepyfile(
+        """
+        from soft_check import check
+
+        def test_no_exception():
+            with check.raises(ValueError):
+                pass
+
+        def test_other():
+            pass
+        """
+    )
+    result = run_with_plugin(*args)
+    result.assert_outcomes(failed=1, passed=0 if args else 1)
+
+
+@pytest.mark.parametrize("args", [(), ("-x",)])
+def test_raises_wrong_exception_fails(pytester, run_with_plugin, args):
+    pytester.makepyfile(
+        """
+        from soft_check import check
+
+        def test_wrong_exception():
+            with check.raises(ValueError):
+                raise TypeError("wrong")
+        """
+    )
+    result = run_with_plugin(*args)
+    result.assert_outcomes(failed=1)
+
+
+def test_raises_expected_exception_passes(pytester, run_with_plugin):
+    pytester.makepyfile(
+        """
+        from soft_check import check
+
+        def test_expected_exception():
+            with check.raises(ValueError):
+                raise ValueError("expected")
+        """
+    )
+    result = run_with_plugin("-x")
+    result.assert_outcomes(passed=1)
+
+
+def test_raises_callable_msg_is_not_called(pytester, run_with_plugin):
+    pytester.makepyfile(
+        """
+        from soft_check import check
+
+        class Message:
+            def __call__(self):
+                return "called!"
+
+            def __str__(self):
+                return "not called"
+
+        def test_callable_msg():
+            with check.raises(ValueError, msg=Message()):
+                pass
+        """
+    )
+    result = run_with_plugin()
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["not called"])
+    result.stdout.no_fnmatch_line("*called!*")
@@ -0,0 +1,41 @@
+import threading
+
+from soft_check import check, check_log
+
+
+def test_nested_messages_are_reported(pytester, run_with_plugin):
+    pytester.makepyfile(
+        """
+        from soft_check import check
+
+        def test_nested():
+            with check("outer"):
+                with check("inner"):
+                    assert 1 == 2
+                assert 3 == 4
+        """
+    )
+    result = run_with_plugin("--check-max-tb=0")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["inner", "assert 1 == 2", "outer", "assert 3 == 4"])
+
+
+def test_message_is_not_shared_between_threads():
+    check_log.clear_failures()
+    entered = threading.Barrier(2)
+
+    def run(msg):
+        with check(msg):
+            entered.wait()
+            assert False
+
+    threads = [threading.Thread(target=run, args=(msg,)) for msg in ("first", "second")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(failure.split("\n")[0] for failure in check_log.get_failures()) == [
+        "first",
+        "second",
+    ]
+    check_log.clear_failures()
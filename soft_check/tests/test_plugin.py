@@ -0,0 +1,24 @@
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("args", "max_tb"),
+    [
+        ((), 1),
+        (("--check-no-tb",), 0),
+        (("--check-max-tb=5",), 5),
+        (("--tb=no",), 0),
+    ],
+)
+def test_max_tb_options(pytester, run_with_plugin, args, max_tb):
+    pytester.makepyfile(
+        f"""
+        from soft_check import check_log
+
+        def test_max_tb():
+            assert check_log.CONFIG.max_tb == {max_tb}
+            assert check_log._state.max_tb == {max_tb}
+        """
+    )
+    result = run_with_plugin(*args)
+    result.assert_outcomes(passed=1)